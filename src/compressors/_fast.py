@@ -0,0 +1,57 @@
+"""JIT-compiled character scan used by TextCompressor when numba is installed."""
+
+try:
+    import numpy as np
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+_ALLOWED_BYTES = b"abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789.,;:()?-"
+
+
+if NUMBA_AVAILABLE:
+    _KEEP_MASK = np.zeros(256, dtype=np.bool_)
+    _KEEP_MASK[np.frombuffer(_ALLOWED_BYTES, dtype=np.uint8)] = True
+
+    @njit(cache=True)
+    def clean_bytes(buf, keep_mask):
+        """
+        Replace runs of disallowed bytes with a single space in one pass.
+
+        Leading and trailing separators are dropped, so the result is already
+        whitespace-collapsed and stripped.
+        """
+        out = np.empty_like(buf)
+        n = 0
+        pending_space = False
+
+        for b in buf:
+            if keep_mask[b]:
+                if pending_space and n > 0:
+                    out[n] = 32
+                    n += 1
+                pending_space = False
+                out[n] = b
+                n += 1
+            else:
+                pending_space = True
+
+        return out[:n]
+
+    def clean_text(text: str) -> str:
+        """
+        Keep only allowed ASCII characters, collapsing everything else into single spaces.
+
+        Args:
+            text: Text to clean
+
+        Returns:
+            Cleaned text
+        """
+        buf = np.frombuffer(text.encode("utf-8", "surrogatepass"), dtype=np.uint8)
+        return clean_bytes(buf, _KEEP_MASK).tobytes().decode("ascii")
+
+    # Compile once at import time so the first compress() call is not penalised
+    clean_text("warm up")
@@ -0,0 +1,75 @@
+from typing import List, Iterable, Iterator
+
+try:
+    from llmlingua import PromptCompressor
+    LLMLINGUA_AVAILABLE = True
+except ImportError:
+    LLMLINGUA_AVAILABLE = False
+
+
+class LLMLinguaCompressor:
+    """
+    Compress text by pruning low-information tokens with an LLMLingua-2 model.
+    Unlike TextCompressor, the output length follows a token rate rather than a hard character cut.
+    """
+
+    def __init__(self, model_name: str = "microsoft/llmlingua-2-xlm-roberta-large-meetingbank",
+                 rate: float = 0.33, device: str = "cpu"):
+        """
+        Initialize the LLMLingua compressor.
+
+        Args:
+            model_name: Hugging Face name of the LLMLingua-2 token classifier
+            rate: Fraction of tokens to keep after compression
+            device: Device to run the model on (e.g., 'cpu', 'cuda')
+        """
+        if not LLMLINGUA_AVAILABLE:
+            raise ImportError("llmlingua library is required for LLMLinguaCompressor. Install it with: pip install llmlingua")
+
+        self.rate = rate
+        self.compressor = PromptCompressor(
+            model_name=model_name,
+            use_llmlingua2=True,
+            device_map=device
+        )
+
+    def compress(self, text: str) -> str:
+        """
+        Compress a single text string.
+
+        Args:
+            text: Text to compress
+
+        Returns:
+            Compressed text
+        """
+        if not text.strip():
+            return ""
+
+        result = self.compressor.compress_prompt(text, rate=self.rate)
+        return result["compressed_prompt"]
+
+    def compress_batch(self, texts: List[str]) -> List[str]:
+        """
+        Compress a batch of texts.
+
+        Args:
+            texts: List of texts to compress
+
+        Returns:
+            List of compressed texts
+        """
+        return [self.compress(text) for text in texts]
+
+    def compress_iter(self, texts: Iterable[str]) -> Iterator[str]:
+        """
+        Lazily compress a stream of texts.
+
+        Args:
+            texts: Iterable of texts to compress
+
+        Yields:
+            Compressed text
+        """
+        for text in texts:
+            yield self.compress(text)
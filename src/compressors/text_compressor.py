@@ -1,5 +1,24 @@
 import re
-from typing import List
+import string
+from typing import List, Iterable, Iterator
+
+from ._fast import NUMBA_AVAILABLE
+
+if NUMBA_AVAILABLE:
+    from ._fast import clean_text
+
+_PAGE = re.compile(r"PAGE\s*\d+", re.IGNORECASE)
+_ALLOWED = frozenset(string.ascii_letters + string.digits + ".,;:()?- ")
+
+
+class _KeepTable(dict):
+    """Translation table mapping every character outside _ALLOWED to a space."""
+
+    def __missing__(self, codepoint: int) -> str:
+        return " "
+
+
+_KEEP_TABLE = _KeepTable({ord(c): c for c in _ALLOWED})
 
 
 class TextCompressor:
@@ -24,17 +43,18 @@ class TextCompressor:
         Returns:
             Compressed text
         """
-        # Remove multiple spaces and newlines
-        text = re.sub(r"\s+", " ", text).strip()
-
         # Remove page numbers and headings
-        text = re.sub(r"PAGE\s*\d+", " ", text, flags=re.IGNORECASE)
+        text = _PAGE.sub(" ", text)
 
-        # Keep only text sentences (drop noisy OCR numbers and special characters)
-        text = re.sub(r"[^a-zA-Z0-9.,;:()?\- ]", " ", text)
+        if NUMBA_AVAILABLE:
+            # Keep only text sentences and remove multiple spaces in one compiled pass
+            text = clean_text(text)
+        else:
+            # Keep only text sentences (drop noisy OCR numbers and special characters)
+            text = text.translate(_KEEP_TABLE)
 
-        # Remove multiple spaces again
-        text = re.sub(r"\s+", " ", text).strip()
+            # Remove multiple spaces
+            text = " ".join(text.split())
 
         # Trim to max length
         return text[:self.max_chars]
@@ -51,6 +71,19 @@ class TextCompressor:
         """
         return [self.compress(text) for text in texts]
 
+    def compress_iter(self, texts: Iterable[str]) -> Iterator[str]:
+        """
+        Lazily compress a stream of texts.
+
+        Args:
+            texts: Iterable of texts to compress
+
+        Yields:
+            Compressed text
+        """
+        for text in texts:
+            yield self.compress(text)
+
     def compress_with_custom_rules(self, text: str, remove_patterns: List[str] = None) -> str:
         """
         Compress text with custom removal patterns.
@@ -67,8 +100,8 @@ class TextCompressor:
 
         # Apply custom patterns if provided
         if remove_patterns:
-            for pattern in remove_patterns:
-                compressed = re.sub(pattern, " ", compressed)
-            compressed = re.sub(r"\s+", " ", compressed).strip()
+            for pattern in map(re.compile, remove_patterns):
+                compressed = pattern.sub(" ", compressed)
+            compressed = " ".join(compressed.split())
 
         return compressed[:self.max_chars]
@@ -1,12 +1,95 @@
+import os
 import fitz
-from typing import List, Dict
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Iterator
+
+# Below this many pages, process-spawn overhead outweighs parallel extraction
+MIN_PAGES_FOR_PARALLEL = 10
+PAGE_BATCH_SIZE = 10
+# Page batches submitted ahead per worker while streaming, bounding memory use
+BATCHES_IN_FLIGHT_PER_WORKER = 2
+# Separators tried in order when a block has to be split, as in TextSplitter
+DEFAULT_SEPARATORS = ["\n\n", "\n", ".", " ", ""]
+# Number of parsed documents an extractor keeps open for reuse
+MAX_CACHED_DOCUMENTS = 4
+
+# Document opened by _init_worker, once per worker process
+_worker_document = None
+
+
+def _init_worker(pdf_path: str):
+    """
+    Open the PDF once when a worker process starts.
+
+    Each worker opens its own document rather than going through the document
+    cache, as a forked worker would otherwise inherit the parent's open
+    document and share its file handle.
+    """
+    global _worker_document
+    _worker_document = fitz.open(pdf_path)
+
+
+def _extract_page_batch(page_indices: List[int]) -> List[Dict[str, any]]:
+    """Extract text from a batch of pages in a worker process."""
+    return [{"page": i + 1, "text": _worker_document[i].get_text("text")} for i in page_indices]
+
+
+def _extract_block_batch(page_indices: List[int]) -> List[List[str]]:
+    """Extract the text blocks of a batch of pages in a worker process."""
+    return [_page_blocks(_worker_document[i]) for i in page_indices]
+
+
+def _page_blocks(page: fitz.Page) -> List[str]:
+    """Get the text blocks of a page in content-stream order, as get_text("text") returns them."""
+    # Block tuples are (x0, y0, x1, y1, text, block_no, block_type); type 1 is an image
+    return [b[4] for b in page.get_text("blocks") if b[6] == 0]
+
+
+def _page_batches(page_count: int) -> List[List[int]]:
+    """Group page indices into batches for the worker processes."""
+    return [list(range(i, min(i + PAGE_BATCH_SIZE, page_count)))
+            for i in range(0, page_count, PAGE_BATCH_SIZE)]
 
 
 class PDFExtractor:
     """Extract text content from PDF files page by page."""
 
     def __init__(self):
-        pass
+        # Parsed documents keyed by (path, mtime), least recently used first
+        self._documents = OrderedDict()
+
+    def _open(self, pdf_path: str) -> fitz.Document:
+        """
+        Open a PDF, reusing the parsed document for repeated calls.
+
+        The modification time is part of the key so an edited file is re-opened.
+
+        Args:
+            pdf_path: Path to the PDF file
+
+        Returns:
+            Open document
+        """
+        key = (pdf_path, os.path.getmtime(pdf_path))
+        if key in self._documents:
+            self._documents.move_to_end(key)
+            return self._documents[key]
+
+        doc = fitz.open(pdf_path)
+        self._documents[key] = doc
+
+        if len(self._documents) > MAX_CACHED_DOCUMENTS:
+            _, oldest = self._documents.popitem(last=False)
+            oldest.close()
+
+        return doc
+
+    def close(self):
+        """Close all documents held open by this extractor."""
+        for doc in self._documents.values():
+            doc.close()
+        self._documents.clear()
 
     def extract_pages(self, pdf_path: str) -> List[Dict[str, any]]:
         """
@@ -18,17 +101,52 @@ class PDFExtractor:
         Returns:
             List of dictionaries containing page number and text content
         """
-        doc = fitz.open(pdf_path)
-        pages = []
+        return list(self.iter_pages(pdf_path))
+
+    def iter_pages(self, pdf_path: str) -> Iterator[Dict[str, any]]:
+        """
+        Lazily extract text from all pages of a PDF file.
+
+        Args:
+            pdf_path: Path to the PDF file
 
+        Yields:
+            Dictionary containing page number and text content
+        """
+        doc = self._open(pdf_path)
         for i in range(len(doc)):
-            page_text = doc[i].get_text("text")
-            pages.append({
+            yield {
                 "page": i + 1,
-                "text": page_text
-            })
+                "text": doc[i].get_text("text")
+            }
+
+    def extract_pages_parallel(self, pdf_path: str,
+                               num_workers: int = min(os.cpu_count() or 1, 4)) -> List[Dict[str, any]]:
+        """
+        Extract text from all pages of a PDF file using a process pool.
+
+        Pages are submitted to the workers in batches. Small PDFs fall back
+        to sequential extraction.
+
+        Args:
+            pdf_path: Path to the PDF file
+            num_workers: Number of worker processes
+
+        Returns:
+            List of dictionaries containing page number and text content
+        """
+        page_count = self.get_page_count(pdf_path)
+        if page_count < MIN_PAGES_FOR_PARALLEL or num_workers <= 1:
+            return self.extract_pages(pdf_path)
+
+        batches = _page_batches(page_count)
+
+        pages = []
+        with ProcessPoolExecutor(max_workers=num_workers, initializer=_init_worker,
+                                 initargs=(pdf_path,)) as executor:
+            for batch in executor.map(_extract_page_batch, batches):
+                pages.extend(batch)
 
-        doc.close()
         return pages
 
     def extract_page_range(self, pdf_path: str, start_page: int, end_page: int) -> List[Dict[str, any]]:
@@ -43,7 +161,7 @@ class PDFExtractor:
         Returns:
             List of dictionaries containing page number and text content
         """
-        doc = fitz.open(pdf_path)
+        doc = self._open(pdf_path)
         pages = []
 
         for i in range(start_page - 1, min(end_page, len(doc))):
@@ -53,9 +171,177 @@ class PDFExtractor:
                 "text": page_text
             })
 
-        doc.close()
         return pages
 
+    def extract_chunks(self, pdf_path: str, chunk_size: int = 1800, chunk_overlap: int = 250,
+                       separators: List[str] = None, num_workers: int = 1) -> List[Dict[str, any]]:
+        """
+        Extract text from all pages of a PDF file directly as chunks.
+
+        Text blocks from PyMuPDF are accumulated per page and a chunk is
+        emitted whenever the buffer would exceed chunk_size, carrying the last
+        chunk_overlap characters into the next chunk. Blocks larger than a
+        chunk are split at the last of the separators that fits.
+
+        Args:
+            pdf_path: Path to the PDF file
+            chunk_size: Maximum size of each chunk
+            chunk_overlap: Number of characters to overlap between chunks
+            separators: Separators to split oversized blocks at, in order of preference
+            num_workers: Number of worker processes used for extraction
+
+        Returns:
+            List of dictionaries containing page number, chunk id and text
+        """
+        return list(self.iter_chunks(pdf_path, chunk_size, chunk_overlap, separators, num_workers))
+
+    def iter_chunks(self, pdf_path: str, chunk_size: int = 1800, chunk_overlap: int = 250,
+                    separators: List[str] = None, num_workers: int = 1) -> Iterator[Dict[str, any]]:
+        """
+        Lazily extract text chunks from all pages of a PDF file.
+
+        With a single worker only one page is held in memory at a time. With
+        more, pages are extracted in batches by a process pool and chunked in
+        page order, with a bounded number of batches extracted ahead.
+
+        Args:
+            pdf_path: Path to the PDF file
+            chunk_size: Maximum size of each chunk
+            chunk_overlap: Number of characters to overlap between chunks
+            separators: Separators to split oversized blocks at, in order of preference
+            num_workers: Number of worker processes used for extraction
+
+        Yields:
+            Dictionary containing page number, chunk id and text
+        """
+        for i, blocks in enumerate(self._iter_page_blocks(pdf_path, num_workers)):
+            parts = self._chunk_blocks(blocks, chunk_size, chunk_overlap, separators) or [""]
+
+            for j, text in enumerate(parts):
+                yield {
+                    "page": i + 1,
+                    "chunk_id": f"{i + 1}_{j + 1}",
+                    "text": text
+                }
+
+    def _iter_page_blocks(self, pdf_path: str, num_workers: int) -> Iterator[List[str]]:
+        """
+        Yield the text blocks of each page in page order.
+
+        Small PDFs and a single worker use the cached document in this process.
+        Otherwise page batches are submitted to a process pool, keeping only
+        BATCHES_IN_FLIGHT_PER_WORKER batches per worker ahead of the consumer.
+
+        Args:
+            pdf_path: Path to the PDF file
+            num_workers: Number of worker processes
+
+        Yields:
+            Text blocks of one page
+        """
+        page_count = self.get_page_count(pdf_path)
+        if page_count < MIN_PAGES_FOR_PARALLEL or num_workers <= 1:
+            doc = self._open(pdf_path)
+            for i in range(page_count):
+                yield _page_blocks(doc[i])
+            return
+
+        batches = _page_batches(page_count)
+        max_pending = BATCHES_IN_FLIGHT_PER_WORKER * num_workers
+        with ProcessPoolExecutor(max_workers=num_workers, initializer=_init_worker,
+                                 initargs=(pdf_path,)) as executor:
+            pending = deque()
+            try:
+                for batch in batches:
+                    pending.append(executor.submit(_extract_block_batch, batch))
+                    if len(pending) >= max_pending:
+                        yield from pending.popleft().result()
+
+                while pending:
+                    yield from pending.popleft().result()
+            finally:
+                # Don't extract batches nobody will read if the consumer stops early
+                for future in pending:
+                    future.cancel()
+
+    @staticmethod
+    def _chunk_blocks(blocks: List[str], chunk_size: int, chunk_overlap: int,
+                      separators: List[str] = None) -> List[str]:
+        """
+        Pack text blocks into overlapping chunks of at most chunk_size characters.
+
+        Args:
+            blocks: Text blocks of one page, in order
+            chunk_size: Maximum size of each chunk
+            chunk_overlap: Number of characters to overlap between chunks
+            separators: Separators to split oversized blocks at, in order of preference
+
+        Returns:
+            List of chunk texts
+        """
+        if separators is None:
+            separators = DEFAULT_SEPARATORS
+
+        chunk_overlap = min(chunk_overlap, chunk_size - 1)
+        chunks = []
+        buffer = ""
+        carried = 0  # Length of the overlap prefix already emitted in a previous chunk
+
+        for block in blocks:
+            block = block.strip()
+            if not block:
+                continue
+
+            if buffer[carried:].strip() and len(buffer) + 1 + len(block) > chunk_size:
+                chunks.append(buffer)
+                buffer = buffer[len(buffer) - chunk_overlap:].lstrip() if chunk_overlap else ""
+                carried = len(buffer)
+
+            buffer = f"{buffer}\n{block}" if buffer else block
+
+            # Split blocks that are larger than a chunk on their own
+            while len(buffer) > chunk_size:
+                # The cut must include new text and leave less than before
+                cut = PDFExtractor._find_split(buffer, chunk_size, max(chunk_overlap, carried), separators)
+                if buffer[carried:cut].strip():
+                    chunks.append(buffer[:cut].strip())
+
+                remainder = buffer[cut - chunk_overlap:]
+                buffer = remainder.lstrip()
+                carried = max(0, chunk_overlap - (len(remainder) - len(buffer)))
+
+        if buffer[carried:].strip():
+            chunks.append(buffer)
+
+        return chunks
+
+    @staticmethod
+    def _find_split(text: str, chunk_size: int, min_cut: int, separators: List[str]) -> int:
+        """
+        Find where to cut text so the first piece ends at a separator within chunk_size.
+
+        Separators are tried in order and the cut must lie beyond min_cut.
+        Falls back to a hard cut at chunk_size.
+
+        Args:
+            text: Text longer than chunk_size
+            chunk_size: Maximum size of each chunk
+            min_cut: The cut must be strictly greater than this index
+            separators: Separators in order of preference
+
+        Returns:
+            Index to cut the text at
+        """
+        for separator in separators:
+            if not separator:
+                break
+
+            index = text.rfind(separator, 0, chunk_size)
+            if index != -1 and index + len(separator) > min_cut:
+                return index + len(separator)
+
+        return chunk_size
+
     def get_page_count(self, pdf_path: str) -> int:
         """
         Get the total number of pages in a PDF.
@@ -66,7 +352,4 @@ class PDFExtractor:
         Returns:
             Total number of pages
         """
-        doc = fitz.open(pdf_path)
-        page_count = len(doc)
-        doc.close()
-        return page_count
+        return len(self._open(pdf_path))
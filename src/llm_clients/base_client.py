@@ -1,5 +1,7 @@
+import asyncio
+import contextlib
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator, AsyncIterator
 
 
 class BaseLLMClient(ABC):
@@ -33,6 +35,70 @@ class BaseLLMClient(ABC):
         """
         pass
 
+    def generate_stream(self, prompt: str, **kwargs) -> Iterator[str]:
+        """
+        Generate text from a prompt, yielding it in pieces as it is produced.
+
+        The default implementation yields the full generate() result at once;
+        clients that support streaming should override it.
+
+        Args:
+            prompt: Input prompt
+            **kwargs: Additional parameters specific to the implementation
+
+        Yields:
+            Generated text fragments
+        """
+        yield self.generate(prompt, **kwargs)
+
+    @contextlib.asynccontextmanager
+    async def async_session(self) -> AsyncIterator[Any]:
+        """
+        Open a transport session for asynchronous requests.
+
+        The session belongs to the caller's event loop and is closed on exit,
+        so concurrent runs on different loops never share one. The default
+        implementation has no session and yields None.
+
+        Yields:
+            Session to pass to agenerate(), or None
+        """
+        yield None
+
+    async def agenerate(self, prompt: str, session: Any = None, **kwargs) -> str:
+        """
+        Asynchronously generate text from a prompt.
+
+        The default implementation runs generate() in a worker thread;
+        clients with a native async transport should override it.
+
+        Args:
+            prompt: Input prompt
+            session: Session from async_session(), if the client uses one
+            **kwargs: Additional parameters specific to the implementation
+
+        Returns:
+            Generated text
+        """
+        return await asyncio.to_thread(self.generate, prompt, **kwargs)
+
+    async def agenerate_stream(self, prompt: str, session: Any = None, **kwargs) -> AsyncIterator[str]:
+        """
+        Asynchronously generate text from a prompt, yielding it in pieces.
+
+        The default implementation yields the full agenerate() result at once;
+        clients that support streaming should override it.
+
+        Args:
+            prompt: Input prompt
+            session: Session from async_session(), if the client uses one
+            **kwargs: Additional parameters specific to the implementation
+
+        Yields:
+            Generated text fragments
+        """
+        yield await self.agenerate(prompt, session=session, **kwargs)
+
     def validate_config(self, config: Dict[str, Any]) -> bool:
         """
         Validate configuration for the LLM client.
@@ -1,5 +1,6 @@
-from groq import Groq
-from typing import List, Dict
+import contextlib
+from groq import Groq, AsyncGroq
+from typing import List, Dict, Iterator, AsyncIterator
 from .base_client import BaseLLMClient
 
 
@@ -17,6 +18,7 @@ class GroqClient(BaseLLMClient):
             temperature: Sampling temperature
             max_tokens: Maximum tokens to generate
         """
+        self.api_key = api_key
         self.client = Groq(api_key=api_key)
         self.model = model
         self.temperature = temperature
@@ -36,6 +38,20 @@ class GroqClient(BaseLLMClient):
         messages = [{"role": "user", "content": prompt}]
         return self.chat(messages, **kwargs)
 
+    def generate_stream(self, prompt: str, **kwargs) -> Iterator[str]:
+        """
+        Generate text from a prompt, streaming the response.
+
+        Args:
+            prompt: Input prompt
+            **kwargs: Additional parameters (temperature, max_tokens, etc.)
+
+        Yields:
+            Generated text fragments
+        """
+        messages = [{"role": "user", "content": prompt}]
+        yield from self.chat_stream(messages, **kwargs)
+
     def chat(self, messages: List[Dict[str, str]], **kwargs) -> str:
         """
         Generate text from a chat conversation.
@@ -59,6 +75,89 @@ class GroqClient(BaseLLMClient):
 
         return response.choices[0].message.content
 
+    def chat_stream(self, messages: List[Dict[str, str]], **kwargs) -> Iterator[str]:
+        """
+        Generate text from a chat conversation, yielding it as it arrives.
+
+        Args:
+            messages: List of message dictionaries with 'role' and 'content'
+            **kwargs: Additional parameters (temperature, max_tokens, etc.)
+
+        Yields:
+            Generated text fragments
+        """
+        temperature = kwargs.get("temperature", self.temperature)
+        max_tokens = kwargs.get("max_tokens", self.max_tokens)
+
+        stream = self.client.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            stream=True
+        )
+
+        for chunk in stream:
+            content = chunk.choices[0].delta.content
+            if content:
+                yield content
+
+    @contextlib.asynccontextmanager
+    async def async_session(self) -> AsyncIterator[AsyncGroq]:
+        """
+        Open an async Groq client bound to the running event loop.
+
+        Yields:
+            AsyncGroq client
+        """
+        async with AsyncGroq(api_key=self.api_key) as client:
+            yield client
+
+    async def agenerate(self, prompt: str, session: AsyncGroq = None, **kwargs) -> str:
+        """
+        Asynchronously generate text from a prompt.
+
+        Args:
+            prompt: Input prompt
+            session: Client from async_session(); a one-off client is opened when not given
+            **kwargs: Additional parameters (temperature, max_tokens, etc.)
+
+        Returns:
+            Generated text
+        """
+        return "".join([fragment async for fragment in self.agenerate_stream(prompt, session=session, **kwargs)])
+
+    async def agenerate_stream(self, prompt: str, session: AsyncGroq = None, **kwargs) -> AsyncIterator[str]:
+        """
+        Asynchronously generate text from a prompt, streaming the response.
+
+        Args:
+            prompt: Input prompt
+            session: Client from async_session(); a one-off client is opened when not given
+            **kwargs: Additional parameters (temperature, max_tokens, etc.)
+
+        Yields:
+            Generated text fragments
+        """
+        if session is None:
+            async with self.async_session() as session:
+                async for fragment in self.agenerate_stream(prompt, session=session, **kwargs):
+                    yield fragment
+            return
+
+        stream = await session.chat.completions.create(
+            model=self.model,
+            messages=[{"role": "user", "content": prompt}],
+            temperature=kwargs.get("temperature", self.temperature),
+            max_tokens=kwargs.get("max_tokens", self.max_tokens),
+            stream=True
+        )
+
+        async for chunk in stream:
+            content = chunk.choices[0].delta.content
+            if content:
+                yield content
+
     def validate_config(self, config: Dict) -> bool:
         """
         Validate Groq configuration.
@@ -1,4 +1,5 @@
-from typing import Dict, Any
+import functools
+from typing import Dict, Any, Tuple
 from .base_client import BaseLLMClient
 from .groq_client import GroqClient
 from .ollama_client import OllamaClient
@@ -24,6 +25,45 @@ class LLMFactory:
         """
         provider = provider.lower()
 
+        # Clients are memoized by provider and config so HTTP sessions are reused
+        try:
+            frozen_config = tuple(sorted(config.items()))
+            hash(frozen_config)
+        except TypeError:
+            return LLMFactory._build_client(provider, config)
+
+        return LLMFactory._create_client_cached(provider, frozen_config)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=8)
+    def _create_client_cached(provider: str, frozen_config: Tuple) -> BaseLLMClient:
+        """
+        Create an LLM client, reusing a previous instance for the same configuration.
+
+        Args:
+            provider: Lowercase provider name
+            frozen_config: Configuration as a sorted tuple of (key, value) pairs
+
+        Returns:
+            LLM client instance
+        """
+        return LLMFactory._build_client(provider, dict(frozen_config))
+
+    @staticmethod
+    def _build_client(provider: str, config: Dict[str, Any]) -> BaseLLMClient:
+        """
+        Construct a new LLM client.
+
+        Args:
+            provider: Lowercase provider name
+            config: Configuration dictionary
+
+        Returns:
+            LLM client instance
+
+        Raises:
+            ValueError: If provider is not supported
+        """
         if provider == "groq":
             return GroqClient(
                 api_key=config.get("api_key"),
@@ -36,7 +76,8 @@ class LLMFactory:
             return OllamaClient(
                 base_url=config.get("base_url", "http://localhost:11434"),
                 model=config.get("model_name", "llama3"),
-                temperature=config.get("temperature", 0)
+                temperature=config.get("temperature", 0),
+                timeout=config.get("timeout", 300)
             )
 
         else:
@@ -1,12 +1,20 @@
-from typing import List, Dict
+import contextlib
+from typing import List, Dict, Any, AsyncIterator
 from .base_client import BaseLLMClient
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
     REQUESTS_AVAILABLE = True
 except ImportError:
     REQUESTS_AVAILABLE = False
 
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
 
 class OllamaClient(BaseLLMClient):
     """
@@ -15,7 +23,8 @@ class OllamaClient(BaseLLMClient):
     """
 
     def __init__(self, base_url: str = "http://localhost:11434",
-                 model: str = "llama3", temperature: float = 0):
+                 model: str = "llama3", temperature: float = 0,
+                 timeout: float = 300, pool_size: int = 16):
         """
         Initialize Ollama client.
 
@@ -23,6 +32,8 @@ class OllamaClient(BaseLLMClient):
             base_url: Ollama server URL
             model: Model name (e.g., 'llama3', 'mistral', etc.)
             temperature: Sampling temperature
+            timeout: Request timeout in seconds
+            pool_size: Number of keep-alive connections to pool
         """
         if not REQUESTS_AVAILABLE:
             raise ImportError("requests library is required for OllamaClient. Install it with: pip install requests")
@@ -30,6 +41,12 @@ class OllamaClient(BaseLLMClient):
         self.base_url = base_url.rstrip('/')
         self.model = model
         self.temperature = temperature
+        self.timeout = timeout
+
+        # Reuse keep-alive connections across requests
+        self.session = requests.Session()
+        self.session.mount(self.base_url, HTTPAdapter(pool_connections=pool_size,
+                                                      pool_maxsize=pool_size))
 
     def generate(self, prompt: str, **kwargs) -> str:
         """
@@ -54,11 +71,67 @@ class OllamaClient(BaseLLMClient):
             }
         }
 
-        response = requests.post(url, json=payload)
+        response = self.session.post(url, json=payload, timeout=self.timeout)
         response.raise_for_status()
 
         return response.json().get("response", "")
 
+    @contextlib.asynccontextmanager
+    async def async_session(self) -> AsyncIterator[Any]:
+        """
+        Open an aiohttp session for asynchronous requests.
+
+        Yields:
+            aiohttp session, or None when aiohttp is not installed
+        """
+        if not AIOHTTP_AVAILABLE:
+            yield None
+            return
+
+        async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=self.timeout)) as session:
+            yield session
+
+    async def agenerate(self, prompt: str, session: Any = None, **kwargs) -> str:
+        """
+        Asynchronously generate text from a prompt.
+
+        Uses aiohttp when available, otherwise falls back to running
+        generate() in a worker thread.
+
+        Args:
+            prompt: Input prompt
+            session: aiohttp session from async_session(); a one-off session
+                is opened when not given
+            **kwargs: Additional parameters (temperature, etc.)
+
+        Returns:
+            Generated text
+        """
+        if not AIOHTTP_AVAILABLE:
+            return await super().agenerate(prompt, **kwargs)
+
+        if session is None:
+            async with self.async_session() as session:
+                return await self.agenerate(prompt, session=session, **kwargs)
+
+        url = f"{self.base_url}/api/generate"
+        temperature = kwargs.get("temperature", self.temperature)
+
+        payload = {
+            "model": self.model,
+            "prompt": prompt,
+            "stream": False,
+            "options": {
+                "temperature": temperature
+            }
+        }
+
+        async with session.post(url, json=payload) as response:
+            response.raise_for_status()
+            data = await response.json()
+
+        return data.get("response", "")
+
     def chat(self, messages: List[Dict[str, str]], **kwargs) -> str:
         """
         Generate text from a chat conversation.
@@ -82,7 +155,7 @@ class OllamaClient(BaseLLMClient):
             }
         }
 
-        response = requests.post(url, json=payload)
+        response = self.session.post(url, json=payload, timeout=self.timeout)
         response.raise_for_status()
 
         return response.json().get("message", {}).get("content", "")
@@ -98,7 +171,7 @@ class OllamaClient(BaseLLMClient):
             True if configuration is valid
         """
         try:
-            response = requests.get(f"{self.base_url}/api/tags")
+            response = self.session.get(f"{self.base_url}/api/tags", timeout=self.timeout)
             return response.status_code == 200
         except Exception:
             return False
@@ -120,9 +120,13 @@ def save_results(results: dict, output_path: str, save_intermediate: bool = Fals
         with open(meta_path, 'w', encoding='utf-8') as f:
             json.dump(results["meta_summaries"], f, indent=2)
 
-        # Save chunks
-        chunks_path = intermediate_dir / "chunks.csv"
-        results["chunks"].to_csv(chunks_path, index=False)
+        # Save chunks (Parquet needs pyarrow or fastparquet; fall back to CSV without them)
+        try:
+            results["chunks"].to_parquet(intermediate_dir / "chunks.parquet",
+                                         compression="zstd", index=False)
+        except ImportError:
+            print("Warning: No Parquet engine installed. Saving chunks as CSV instead.")
+            results["chunks"].to_csv(intermediate_dir / "chunks.csv", index=False)
 
         print(f"Intermediate results saved to: {intermediate_dir}")
 
@@ -1,5 +1,5 @@
 from langchain_text_splitters import RecursiveCharacterTextSplitter
-from typing import List, Dict
+from typing import List, Dict, Iterable, Iterator
 import pandas as pd
 
 
@@ -35,7 +35,10 @@ class TextSplitter:
         Returns:
             DataFrame with columns: page, chunk_id, text
         """
-        chunks = []
+        # Build columns directly rather than a list of per-row dicts
+        pages_col = []
+        ids_col = []
+        texts_col = []
 
         for pg in pages:
             page_text = pg["text"] or ""
@@ -45,29 +48,117 @@ class TextSplitter:
                 parts = [""]
 
             for j, text in enumerate(parts):
-                chunks.append({
+                pages_col.append(pg["page"])
+                ids_col.append(f"{pg['page']}_{j + 1}")
+                texts_col.append(text)
+
+        return pd.DataFrame({"page": pages_col, "chunk_id": ids_col, "text": texts_col})
+
+    def split_pages_iter(self, pages: Iterable[Dict[str, any]]) -> Iterator[Dict[str, any]]:
+        """
+        Lazily split pages into chunks.
+
+        Args:
+            pages: Iterable of page dictionaries with 'page' and 'text' keys
+
+        Yields:
+            Dictionary with keys: page, chunk_id, text
+        """
+        for pg in pages:
+            parts = self.splitter.split_text(pg["text"] or "") or [""]
+
+            for j, text in enumerate(parts):
+                yield {
                     "page": pg["page"],
                     "chunk_id": f"{pg['page']}_{j + 1}",
                     "text": text
-                })
-
-        return pd.DataFrame(chunks)
+                }
 
-    def create_meta_sections(self, df_chunks: pd.DataFrame, meta_size: int = 5) -> List[str]:
+    def create_meta_sections(self, df_chunks: pd.DataFrame, meta_size: int = 5,
+                             token_budget: int = None, tokenizer=None) -> List[str]:
         """
         Create meta-sections by combining chunks.
 
         Args:
             df_chunks: DataFrame containing chunks
             meta_size: Number of chunks to combine into one meta-section
+            token_budget: If set, pack chunks greedily up to this many tokens
+                per meta-section instead of using meta_size
+            tokenizer: Optional tokenizer with an encode() method; token counts
+                are estimated as chars / 4 when not given
 
         Returns:
             List of meta-section texts
         """
-        meta_sections = []
+        # Join slices of the underlying object array, avoiding .iloc and tolist() copies
+        texts = df_chunks["text"].to_numpy(dtype=object)
+
+        if token_budget is not None:
+            return list(self._pack_by_tokens(texts, token_budget, tokenizer))
+
+        return ["\n".join(texts[i:i + meta_size]) for i in range(0, len(texts), meta_size)]
+
+    def create_meta_sections_iter(self, chunks: Iterable[Dict[str, any]], meta_size: int = 5,
+                                  token_budget: int = None, tokenizer=None) -> Iterator[str]:
+        """
+        Lazily create meta-sections by combining chunks.
+
+        Args:
+            chunks: Iterable of chunk dictionaries with a 'text' key
+            meta_size: Number of chunks to combine into one meta-section
+            token_budget: If set, pack chunks greedily up to this many tokens
+                per meta-section instead of using meta_size
+            tokenizer: Optional tokenizer with an encode() method; token counts
+                are estimated as chars / 4 when not given
+
+        Yields:
+            Meta-section text
+        """
+        texts = (chunk["text"] for chunk in chunks)
+
+        if token_budget is not None:
+            yield from self._pack_by_tokens(texts, token_budget, tokenizer)
+            return
+
+        buffer = []
+
+        for text in texts:
+            buffer.append(text)
+            if len(buffer) == meta_size:
+                yield "\n".join(buffer)
+                buffer = []
+
+        if buffer:
+            yield "\n".join(buffer)
+
+    @staticmethod
+    def _pack_by_tokens(texts: Iterable[str], token_budget: int, tokenizer=None) -> Iterator[str]:
+        """
+        Greedily pack texts into meta-sections of at most token_budget tokens.
+
+        A single text larger than the budget becomes a meta-section on its own.
+
+        Args:
+            texts: Iterable of chunk texts
+            token_budget: Maximum number of tokens per meta-section
+            tokenizer: Optional tokenizer with an encode() method
+
+        Yields:
+            Meta-section text
+        """
+        buffer = []
+        buffer_tokens = 0
+
+        for text in texts:
+            tokens = len(tokenizer.encode(text)) if tokenizer is not None else len(text) // 4
+
+            if buffer and buffer_tokens + tokens > token_budget:
+                yield "\n".join(buffer)
+                buffer = []
+                buffer_tokens = 0
 
-        for i in range(0, len(df_chunks), meta_size):
-            meta_text = "\n".join(df_chunks["text"].iloc[i:i + meta_size].tolist())
-            meta_sections.append(meta_text)
+            buffer.append(text)
+            buffer_tokens += tokens
 
-        return meta_sections
+        if buffer:
+            yield "\n".join(buffer)
@@ -1,11 +1,25 @@
-from typing import List, Dict
+import asyncio
+import os
+import queue
+import re
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+from typing import (List, Dict, Tuple, Iterable, Iterator, AsyncIterable, AsyncIterator,
+                    Optional, Callable, Any)
 from tqdm import tqdm
 import pandas as pd
 
 from ..extractors.pdf_extractor import PDFExtractor
 from ..splitters.text_splitter import TextSplitter
 from ..compressors.text_compressor import TextCompressor
+from ..compressors.llmlingua_compressor import LLMLinguaCompressor
 from ..llm_clients.base_client import BaseLLMClient
+from ..utils.cache import StageCache
+
+# A "###SECTION <N>" header followed by its summary, up to the next marker. Markers
+# need not start a line, and a trailing header may have no newline after it.
+_SECTION_RE = re.compile(r"###SECTION\s*(\d+)[^\S\n]*(?=\n|###SECTION|\Z)\n?(.*?)(?=###SECTION|\Z)",
+                         re.DOTALL)
 
 
 class HierarchicalSummarizer:
@@ -25,18 +39,57 @@ class HierarchicalSummarizer:
         self.llm_client = llm_client
         self.config = config
 
+        self.chunk_size = config.get("chunk_size", 1800)
+        self.chunk_overlap = config.get("chunk_overlap", 250)
+        self.separators = config.get("separators", ["\n\n", "\n", ".", " ", ""])
+        extraction_workers = config.get("extraction_workers")
+        self.extraction_workers = min(os.cpu_count() or 1, 4) if extraction_workers is None else extraction_workers
+
         # Initialize components
         self.pdf_extractor = PDFExtractor()
         self.text_splitter = TextSplitter(
-            chunk_size=config.get("chunk_size", 1800),
-            chunk_overlap=config.get("chunk_overlap", 250),
-            separators=config.get("separators", ["\n\n", "\n", ".", " ", ""])
-        )
-        self.text_compressor = TextCompressor(
-            max_chars=config.get("compression_max_chars", 700)
+            chunk_size=self.chunk_size,
+            chunk_overlap=self.chunk_overlap,
+            separators=self.separators
         )
+        self.text_compressor = self._create_compressor(config)
 
         self.meta_section_size = config.get("meta_section_size", 5)
+        self.meta_section_token_budget = config.get("meta_section_token_budget")
+
+        self.cache = StageCache(config.get("cache_dir")) if config.get("cache_enabled", True) else None
+
+    @staticmethod
+    def _create_compressor(config: Dict):
+        """
+        Create the meta-section compressor selected by 'compression_strategy'.
+
+        Falls back to the rule-based TextCompressor when LLMLingua is not installed.
+
+        Args:
+            config: Configuration dictionary
+
+        Returns:
+            Compressor instance
+        """
+        strategy = config.get("compression_strategy", "regex")
+
+        if strategy == "llmlingua":
+            try:
+                return LLMLinguaCompressor(
+                    model_name=config.get("llmlingua_model",
+                                          "microsoft/llmlingua-2-xlm-roberta-large-meetingbank"),
+                    rate=config.get("compression_rate", 0.33),
+                    device=config.get("llmlingua_device", "cpu")
+                )
+            except ImportError as e:
+                print(f"Warning: {e}. Falling back to rule-based compression.")
+
+        elif strategy != "regex":
+            raise ValueError(f"Unsupported compression strategy: {strategy}. "
+                             f"Supported strategies: regex, llmlingua")
+
+        return TextCompressor(max_chars=config.get("compression_max_chars", 700))
 
     def process_pdf(self, pdf_path: str, save_intermediate: bool = True) -> Dict:
         """
@@ -51,31 +104,27 @@ class HierarchicalSummarizer:
         """
         print(f"Processing PDF: {pdf_path}")
 
-        # Step 1: Extract pages
-        print("Step 1: Extracting pages...")
-        pages = self.pdf_extractor.extract_pages(pdf_path)
-        print(f"Extracted {len(pages)} pages")
-
-        # Step 2: Split into chunks
-        print("Step 2: Splitting text into chunks...")
-        df_chunks = self.text_splitter.split_pages(pages)
-        print(f"Created {len(df_chunks)} chunks")
+        # Intermediate stages are cached by PDF content and the settings that affect them
+        pdf_hash = self.cache.hash_file(pdf_path) if self.cache else None
 
-        # Step 3: Create meta-sections
-        print("Step 3: Creating meta-sections...")
-        meta_sections = self.text_splitter.create_meta_sections(
-            df_chunks, self.meta_section_size
-        )
-        print(f"Created {len(meta_sections)} meta-sections")
+        # Steps 1-4: Extract, chunk, group and compress
+        print("Steps 1-4: Extracting, chunking and compressing meta-sections...")
+        compression_key = f"{pdf_hash}:compressed:{self._compression_config_hash()}" if self.cache else None
+        stage = self._cached(compression_key, lambda: self._compress_pdf(pdf_path, save_intermediate),
+                             lambda cached: not save_intermediate or cached["chunks"] is not None)
+        compressed_meta = stage["compressed_meta"]
+        meta_sections = stage["meta_sections"] if save_intermediate else None
+        df_chunks = pd.DataFrame(stage["chunks"]) if save_intermediate else None
 
-        # Step 4: Compress meta-sections
-        print("Step 4: Compressing meta-sections...")
-        compressed_meta = self.text_compressor.compress_batch(meta_sections)
+        print(f"Created {len(compressed_meta)} meta-sections")
         print(f"Compressed to average {sum(len(s) for s in compressed_meta) // len(compressed_meta)} chars per section")
 
         # Step 5: Generate meta-summaries
         print("Step 5: Generating meta-summaries...")
-        meta_summaries = self._generate_meta_summaries(compressed_meta)
+        summaries_key = (f"{pdf_hash}:meta_summaries:{self._meta_summaries_hash(compressed_meta)}"
+                         if self.cache else None)
+        meta_summaries = self._cached(summaries_key, lambda: self._summarize_meta_sections(compressed_meta),
+                                      lambda cached: self._has_all_sections(cached, len(compressed_meta)))
         print(f"Generated {len(meta_summaries)} meta-summaries")
 
         # Step 6: Generate global summary
@@ -84,7 +133,6 @@ class HierarchicalSummarizer:
         print("Global summary generated")
 
         return {
-            "pages": pages,
             "chunks": df_chunks,
             "meta_sections": meta_sections,
             "compressed_meta": compressed_meta,
@@ -92,20 +140,258 @@ class HierarchicalSummarizer:
             "global_summary": global_summary
         }
 
+    def _compress_pdf(self, pdf_path: str, save_intermediate: bool) -> Dict:
+        """
+        Run the extraction, chunking and compression steps.
+
+        The steps are streamed: pages are chunked, grouped into meta-sections
+        and compressed lazily, so only the compressed text and a bounded
+        window of extracted pages are held in memory.
+        Chunks and meta-sections are only kept when save_intermediate is set.
+
+        Args:
+            pdf_path: Path to PDF file
+            save_intermediate: Whether to keep chunks and meta-sections
+
+        Returns:
+            Dictionary with chunks, meta_sections and compressed_meta
+        """
+        chunks = [] if save_intermediate else None
+        meta_sections = [] if save_intermediate else None
+
+        chunk_iter = self._collect(
+            self.pdf_extractor.iter_chunks(pdf_path, self.chunk_size, self.chunk_overlap,
+                                           self.separators, self.extraction_workers),
+            chunks
+        )
+        meta_iter = self._collect(
+            self.text_splitter.create_meta_sections_iter(
+                chunk_iter, self.meta_section_size, token_budget=self.meta_section_token_budget
+            ),
+            meta_sections
+        )
+        try:
+            compressed_meta = list(self.text_compressor.compress_iter(meta_iter))
+        finally:
+            self.pdf_extractor.close()
+
+        return {
+            "chunks": chunks,
+            "meta_sections": meta_sections,
+            "compressed_meta": compressed_meta
+        }
+
+    def _summarize_meta_sections(self, compressed_meta: List[str]) -> List[Dict]:
+        """
+        Generate meta-summaries with the async or thread-pool path, per 'async_llm'.
+
+        asyncio.run() cannot be used when the caller already runs an event loop
+        (e.g. Jupyter or an async service), so the thread-pool path is used then.
+
+        Args:
+            compressed_meta: List of compressed meta-sections
+
+        Returns:
+            List of meta-summary dictionaries
+        """
+        if self.config.get("async_llm", True) and not self._in_event_loop():
+            return asyncio.run(self._generate_meta_summaries_async(compressed_meta))
+        return self._generate_meta_summaries(compressed_meta)
+
+    @staticmethod
+    def _in_event_loop() -> bool:
+        """Check whether an asyncio event loop is running in the current thread."""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+        return True
+
+    def _cached(self, key: str, compute: Callable[[], Any],
+                is_usable: Callable[[Any], bool] = None) -> Any:
+        """
+        Load a stage result from the cache, computing and storing it on a miss.
+
+        Empty results and results failing is_usable (e.g. an LLM reply that
+        was cut off) are not stored, so the stage is retried on the next run.
+
+        Args:
+            key: Cache key
+            compute: Function producing the result
+            is_usable: Optional check that a result is complete enough to cache
+
+        Returns:
+            Stage result
+        """
+        if self.cache is None:
+            return compute()
+
+        value = self.cache.get(key)
+        if value is not None and (is_usable is None or is_usable(value)):
+            print("Loaded from cache")
+            return value
+
+        value = compute()
+        if value and (is_usable is None or is_usable(value)):
+            self.cache.put(key, value)
+        return value
+
+    @staticmethod
+    def _has_all_sections(meta_summaries: List[Dict], section_count: int) -> bool:
+        """Check that the meta-summaries cover sections 1 to section_count."""
+        return {summary["section"] for summary in meta_summaries} >= set(range(1, section_count + 1))
+
+    def _compression_config_hash(self) -> str:
+        """Hash the settings that affect the extraction and compression steps."""
+        keys = ["chunk_size", "chunk_overlap", "separators", "meta_section_size",
+                "meta_section_token_budget", "compression_max_chars", "compression_rate", "llmlingua_model"]
+        settings = {key: self.config.get(key) for key in keys}
+
+        # Key on the compressor in use, not the configured strategy, which may have fallen back
+        settings["compressor"] = type(self.text_compressor).__name__
+        return StageCache.hash_value(settings)
+
+    def _meta_summaries_hash(self, compressed_meta: List[str]) -> str:
+        """Hash the prompts and model settings that determine the meta-summaries."""
+        return StageCache.hash_value({
+            "client": type(self.llm_client).__name__,
+            "model": getattr(self.llm_client, "model", None),
+            "temperature": getattr(self.llm_client, "temperature", None),
+            "max_tokens": self.config.get("max_tokens_meta", 3500),
+            "prompts": self._build_meta_prompts(compressed_meta)
+        })
+
+    @staticmethod
+    def _collect(items: Iterable, sink: Optional[List]) -> Iterator:
+        """
+        Pass items through, appending each one to sink if it is given.
+
+        Args:
+            items: Iterable to pass through
+            sink: List to record items in, or None
+
+        Yields:
+            Items from the iterable
+        """
+        for item in items:
+            if sink is not None:
+                sink.append(item)
+            yield item
+
     def _generate_meta_summaries(self, compressed_meta: List[str]) -> List[Dict]:
         """
         Generate summaries for each meta-section.
 
+        Meta-sections are sent in small batches, one LLM request per batch,
+        and the requests are issued concurrently. Responses are streamed and
+        each section is handed back to this thread as soon as it is parsed.
+
         Args:
             compressed_meta: List of compressed meta-sections
 
         Returns:
             List of meta-summary dictionaries
         """
+        prompts = self._build_meta_prompts(compressed_meta)
+
+        # Generate summaries
+        max_tokens = self.config.get("max_tokens_meta", 3500)
+        max_workers = max(1, min(self.config.get("llm_concurrency", 8), len(prompts)))
+
+        # Workers put parsed sections on the queue, then None once their stream ends
+        sections = queue.Queue()
+
+        def generate(prompt: str):
+            try:
+                stream = self.llm_client.generate_stream(prompt, max_tokens=max_tokens)
+                for summary in self._iter_meta_summaries(stream):
+                    sections.put(summary)
+            finally:
+                sections.put(None)
+
+        meta_summaries = []
+        with ThreadPoolExecutor(max_workers=max_workers) as executor, \
+                tqdm(total=len(compressed_meta), desc="Meta-summaries") as progress:
+            futures = [executor.submit(generate, prompt) for prompt in prompts]
+
+            finished = 0
+            while finished < len(futures):
+                summary = sections.get()
+                if summary is None:
+                    finished += 1
+                else:
+                    meta_summaries.append(summary)
+                    progress.update(1)
+
+            # Re-raise any error from the workers
+            for future in futures:
+                future.result()
+
+        return sorted(meta_summaries, key=itemgetter("section"))
+
+    async def _generate_meta_summaries_async(self, compressed_meta: List[str]) -> List[Dict]:
+        """
+        Generate summaries for each meta-section using asyncio.
+
+        Batches are requested concurrently on a single thread, with at most
+        'llm_concurrency' requests in flight at once. Responses are streamed
+        and each section is collected as soon as it is parsed.
+
+        Args:
+            compressed_meta: List of compressed meta-sections
+
+        Returns:
+            List of meta-summary dictionaries
+        """
+        prompts = self._build_meta_prompts(compressed_meta)
+        max_tokens = self.config.get("max_tokens_meta", 3500)
+        semaphore = asyncio.Semaphore(max(1, self.config.get("llm_concurrency", 8)))
+        meta_summaries = []
+
+        # The session is opened on this run's event loop, so runs never share one
+        async with self.llm_client.async_session() as session:
+            with tqdm(total=len(compressed_meta), desc="Meta-summaries") as progress:
+                async def generate(prompt: str):
+                    async with semaphore:
+                        stream = self.llm_client.agenerate_stream(prompt, session=session, max_tokens=max_tokens)
+                        async for summary in self._aiter_meta_summaries(stream):
+                            meta_summaries.append(summary)
+                            progress.update(1)
+
+                await asyncio.gather(*(generate(prompt) for prompt in prompts))
+
+        return sorted(meta_summaries, key=itemgetter("section"))
+
+    def _build_meta_prompts(self, compressed_meta: List[str]) -> List[str]:
+        """
+        Group meta-sections into batches of 'meta_batch_size' and build one prompt per batch.
+
+        Args:
+            compressed_meta: List of compressed meta-sections
+
+        Returns:
+            List of prompts
+        """
+        batch_size = self.config.get("meta_batch_size", 4)
+        return [
+            self._build_meta_prompt(list(enumerate(compressed_meta[i:i + batch_size], start=i + 1)))
+            for i in range(0, len(compressed_meta), batch_size)
+        ]
+
+    def _build_meta_prompt(self, sections: List[Tuple[int, str]]) -> str:
+        """
+        Build the meta-summary prompt for a batch of meta-sections.
+
+        Args:
+            sections: List of (section number, compressed text) tuples
+
+        Returns:
+            Prompt text
+        """
         meta_prompt = """
 You are an expert at summarizing regulatory and legal documents.
 
-Below are multiple META-SECTIONS.
+Below are one or more META-SECTIONS.
 Each META-SECTION is a pre-compressed excerpt from the original document.
 
 Your task:
@@ -121,28 +407,80 @@ Your task:
 META-SECTIONS BELOW:
 """
 
-        for i, sec in enumerate(compressed_meta):
-            meta_prompt += f"\n<META id='{i + 1}'> {sec} </META>"
+        for number, sec in sections:
+            meta_prompt += f"\n<META id='{number}'> {sec} </META>"
 
-        # Generate summaries
-        max_tokens = self.config.get("max_tokens_meta", 3500)
-        response = self.llm_client.generate(meta_prompt, max_tokens=max_tokens)
+        return meta_prompt
 
-        # Parse response
-        meta_summaries = []
-        for block in response.split("###SECTION"):
-            block = block.strip()
-            if not block or not block[0].isdigit():
-                continue
+    def _iter_meta_summaries(self, stream: Iterable[str]) -> Iterator[Dict]:
+        """
+        Incrementally parse a streamed LLM response into meta-summary dictionaries.
 
-            try:
-                number = int(block.split("\n")[0].strip())
-                summary = "\n".join(block.split("\n")[1:]).strip()
-                meta_summaries.append({"section": number, "summary": summary})
-            except (ValueError, IndexError):
-                continue
+        A section is emitted as soon as the next ###SECTION marker arrives. The
+        result is the same as parsing the full response at once.
+
+        Args:
+            stream: Iterable of response text fragments
+
+        Yields:
+            Meta-summary dictionary
+        """
+        buffer = ""
+        for fragment in stream:
+            complete, buffer = self._split_complete_sections(buffer + fragment)
+            yield from complete
+
+        yield from self._parse_meta_summaries(buffer)
+
+    async def _aiter_meta_summaries(self, stream: AsyncIterable[str]) -> AsyncIterator[Dict]:
+        """
+        Incrementally parse an asynchronously streamed LLM response.
+
+        Args:
+            stream: Async iterable of response text fragments
+
+        Yields:
+            Meta-summary dictionary
+        """
+        buffer = ""
+        async for fragment in stream:
+            complete, buffer = self._split_complete_sections(buffer + fragment)
+            for summary in complete:
+                yield summary
+
+        for summary in self._parse_meta_summaries(buffer):
+            yield summary
 
-        return sorted(meta_summaries, key=lambda x: x["section"])
+    def _split_complete_sections(self, buffer: str) -> Tuple[List[Dict], str]:
+        """
+        Parse the sections of a partial response that can no longer change.
+
+        Every section ends at the next ###SECTION marker, so everything before
+        the last marker is complete; the rest is kept for more text to arrive.
+
+        Args:
+            buffer: Response text received so far
+
+        Returns:
+            Tuple of (parsed complete sections, remaining text)
+        """
+        boundary = buffer.rfind("###SECTION")
+        if boundary <= 0:
+            return [], buffer
+        return self._parse_meta_summaries(buffer[:boundary]), buffer[boundary:]
+
+    def _parse_meta_summaries(self, response: str) -> List[Dict]:
+        """
+        Parse an LLM response into meta-summary dictionaries.
+
+        Args:
+            response: LLM response in ###SECTION format
+
+        Returns:
+            List of meta-summary dictionaries
+        """
+        return [{"section": int(m.group(1)), "summary": m.group(2).strip()}
+                for m in _SECTION_RE.finditer(response)]
 
     def _generate_global_summary(self, meta_summaries: List[Dict]) -> str:
         """
@@ -0,0 +1,93 @@
+import hashlib
+import json
+import pickle
+from pathlib import Path
+from typing import Any
+
+
+class StageCache:
+    """Content-addressed disk cache for intermediate pipeline results."""
+
+    def __init__(self, cache_dir: str = None):
+        """
+        Initialize the stage cache.
+
+        Args:
+            cache_dir: Directory to store cached results in
+        """
+        if cache_dir is None:
+            cache_dir = Path(__file__).parent.parent.parent / "data" / "cache"
+
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: str) -> Path:
+        """Map a cache key to a file path."""
+        return self.cache_dir / f"{hashlib.blake2b(key.encode('utf-8'), digest_size=16).hexdigest()}.pkl"
+
+    def get(self, key: str) -> Any:
+        """
+        Load a cached value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value, or None if not cached
+        """
+        path = self._path(key)
+        if not path.exists():
+            return None
+
+        try:
+            with open(path, 'rb') as f:
+                return pickle.load(f)
+        except (pickle.UnpicklingError, EOFError):
+            return None
+
+    def put(self, key: str, value: Any):
+        """
+        Store a value in the cache.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+        """
+        path = self._path(key)
+        tmp_path = path.with_suffix(".tmp")
+
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        tmp_path.replace(path)
+
+    @staticmethod
+    def hash_file(path: str, block_size: int = 1 << 20) -> str:
+        """
+        Hash the contents of a file.
+
+        Args:
+            path: Path to the file
+            block_size: Number of bytes to read at a time
+
+        Returns:
+            Hex digest of the file contents
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(block_size), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+    @staticmethod
+    def hash_value(value: Any) -> str:
+        """
+        Hash a JSON-serialisable value such as a config dictionary or list of prompts.
+
+        Args:
+            value: Value to hash
+
+        Returns:
+            Hex digest of the value
+        """
+        data = json.dumps(value, sort_keys=True, default=str).encode('utf-8')
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
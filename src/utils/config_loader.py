@@ -36,7 +36,12 @@ class ConfigLoader:
                 "chunk_size": 1800,
                 "chunk_overlap": 250,
                 "meta_section_size": 5,
-                "compression_max_chars": 700
+                "compression_max_chars": 700,
+                "compression_strategy": "regex",
+                "meta_batch_size": 4,
+                "llm_concurrency": 8,
+                "async_llm": True,
+                "cache_enabled": True
             },
             "models": {
                 "groq": {
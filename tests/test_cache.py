@@ -0,0 +1,98 @@
+import pytest
+
+from src.compressors.text_compressor import TextCompressor
+from src.compressors.llmlingua_compressor import LLMLinguaCompressor
+from src.summarizers.hierarchical_summarizer import HierarchicalSummarizer
+from src.utils.cache import StageCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return StageCache(tmp_path / "cache")
+
+
+@pytest.fixture
+def summarizer(cache):
+    summarizer = HierarchicalSummarizer.__new__(HierarchicalSummarizer)
+    summarizer.cache = cache
+    summarizer.config = {"chunk_size": 1800}
+    summarizer.text_compressor = TextCompressor()
+    return summarizer
+
+
+def test_get_returns_stored_value(cache):
+    assert cache.get("key") is None
+
+    cache.put("key", {"compressed_meta": ["a", "b"]})
+    assert cache.get("key") == {"compressed_meta": ["a", "b"]}
+    assert cache.get("other") is None
+
+
+def test_corrupt_entry_is_a_miss(cache):
+    cache.put("key", [1, 2, 3])
+    cache._path("key").write_bytes(b"not a pickle")
+
+    assert cache.get("key") is None
+
+
+def test_hash_file_changes_with_contents(tmp_path):
+    path = tmp_path / "doc.pdf"
+    path.write_bytes(b"first")
+    first = StageCache.hash_file(str(path))
+
+    assert StageCache.hash_file(str(path)) == first
+    path.write_bytes(b"second")
+    assert StageCache.hash_file(str(path)) != first
+
+
+def test_hash_value_ignores_key_order():
+    assert StageCache.hash_value({"a": 1, "b": 2}) == StageCache.hash_value({"b": 2, "a": 1})
+    assert StageCache.hash_value({"a": 1}) != StageCache.hash_value({"a": 2})
+
+
+def test_cached_computes_once(summarizer):
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return ["summary"]
+
+    assert summarizer._cached("key", compute) == ["summary"]
+    assert summarizer._cached("key", compute) == ["summary"]
+    assert len(calls) == 1
+
+
+def test_cached_does_not_store_empty_result(summarizer):
+    assert summarizer._cached("key", list) == []
+    assert summarizer.cache.get("key") is None
+
+
+def test_cached_recomputes_unusable_value(summarizer):
+    summarizer.cache.put("key", {"chunks": None})
+
+    value = summarizer._cached("key", lambda: {"chunks": []}, lambda v: v["chunks"] is not None)
+    assert value == {"chunks": []}
+
+
+def test_config_hash_changes_with_settings_and_compressor(summarizer):
+    base = summarizer._compression_config_hash()
+
+    summarizer.config = {"chunk_size": 1000}
+    assert summarizer._compression_config_hash() != base
+
+    summarizer.config = {"chunk_size": 1800}
+    summarizer.text_compressor = LLMLinguaCompressor.__new__(LLMLinguaCompressor)
+    assert summarizer._compression_config_hash() != base
+
+
+def test_cached_does_not_store_incomplete_meta_summaries(summarizer):
+    # A reply cut off by max_tokens parses to fewer sections than were requested
+    partial = [{"section": 1, "summary": "a"}, {"section": 2, "summary": "b"}]
+    is_usable = lambda cached: summarizer._has_all_sections(cached, 3)
+
+    assert summarizer._cached("key", lambda: partial, is_usable) == partial
+    assert summarizer.cache.get("key") is None
+
+    complete = partial + [{"section": 3, "summary": "c"}]
+    assert summarizer._cached("key", lambda: complete, is_usable) == complete
+    assert summarizer.cache.get("key") == complete
@@ -0,0 +1,68 @@
+import asyncio
+import random
+
+import pytest
+
+from src.summarizers.hierarchical_summarizer import HierarchicalSummarizer
+
+
+RESPONSES = [
+    "###SECTION 1\nFirst summary.\n\n###SECTION 2\nSecond summary.\n",
+    "Here are the summaries:\n###SECTION 1\nfoo ###SECTION 2\nbar",
+    "###SECTION 1\nA text\n###SECTION 2\nB text ###SECTION ref.\n###SECTION 3",
+    "###SECTION 10\nmulti\nline\nsummary\n###SECTION 9\r\nunsorted",
+    "no sections at all",
+    "",
+]
+
+
+@pytest.fixture
+def summarizer():
+    # The parsing helpers only need the instance, not a client or config
+    return HierarchicalSummarizer.__new__(HierarchicalSummarizer)
+
+
+def _random_fragments(text, rng):
+    fragments = []
+    i = 0
+    while i < len(text):
+        size = rng.randint(1, 12)
+        fragments.append(text[i:i + size])
+        i += size
+    return fragments
+
+
+def test_parse_keeps_mid_line_and_trailing_sections(summarizer):
+    assert summarizer._parse_meta_summaries("###SECTION 1\nfoo ###SECTION 2\nbar") == [
+        {"section": 1, "summary": "foo"},
+        {"section": 2, "summary": "bar"},
+    ]
+    assert summarizer._parse_meta_summaries("###SECTION 1\nfoo\n###SECTION 3") == [
+        {"section": 1, "summary": "foo"},
+        {"section": 3, "summary": ""},
+    ]
+
+
+@pytest.mark.parametrize("response", RESPONSES)
+def test_streamed_parse_matches_full_parse(summarizer, response):
+    expected = summarizer._parse_meta_summaries(response)
+    rng = random.Random(0)
+
+    for _ in range(200):
+        fragments = _random_fragments(response, rng)
+        assert list(summarizer._iter_meta_summaries(fragments)) == expected
+
+
+@pytest.mark.parametrize("response", RESPONSES)
+def test_async_streamed_parse_matches_full_parse(summarizer, response):
+    expected = summarizer._parse_meta_summaries(response)
+    fragments = _random_fragments(response, random.Random(1))
+
+    async def stream():
+        for fragment in fragments:
+            yield fragment
+
+    async def collect():
+        return [summary async for summary in summarizer._aiter_meta_summaries(stream())]
+
+    assert asyncio.run(collect()) == expected
@@ -0,0 +1,150 @@
+import os
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+import fitz
+import pytest
+
+from src.extractors import pdf_extractor
+from src.extractors.pdf_extractor import PDFExtractor, MIN_PAGES_FOR_PARALLEL, MAX_CACHED_DOCUMENTS
+
+
+WORDS = ["alpha", "be", "gamma.", "d", "\n"]
+
+
+def _blocks(rng, count):
+    return [" ".join(rng.choice(WORDS) for _ in range(rng.randint(0, 40))) for _ in range(count)]
+
+
+@pytest.fixture
+def pdf_path(tmp_path):
+    path = tmp_path / "sample.pdf"
+    doc = fitz.open()
+    for i in range(MIN_PAGES_FOR_PARALLEL + 5):
+        page = doc.new_page()
+        # Leave one page empty
+        if i != 3:
+            page.insert_textbox(fitz.Rect(50, 50, 550, 400), f"Page {i + 1} heading.\n" + "Lorem ipsum dolor. " * 30)
+            page.insert_textbox(fitz.Rect(50, 450, 550, 800), f"Second block of page {i + 1}.")
+    doc.save(path)
+    doc.close()
+    return str(path)
+
+
+def _write_pdf(path, text):
+    doc = fitz.open()
+    doc.new_page().insert_text((50, 50), text)
+    doc.save(path)
+    doc.close()
+    return str(path)
+
+
+@pytest.mark.parametrize("chunk_size, chunk_overlap", [(5, 0), (12, 3), (30, 10), (60, 59)])
+def test_chunk_blocks_respects_chunk_size(chunk_size, chunk_overlap):
+    rng = random.Random(chunk_size)
+
+    for _ in range(200):
+        chunks = PDFExtractor._chunk_blocks(_blocks(rng, rng.randint(0, 5)), chunk_size, chunk_overlap)
+        assert all(0 < len(chunk) <= chunk_size for chunk in chunks)
+        assert all(chunk == chunk.strip() for chunk in chunks)
+
+
+def test_chunk_blocks_overlap():
+    blocks = [f"block {i} " + "word " * 5 for i in range(10)]
+    chunks = PDFExtractor._chunk_blocks(blocks, chunk_size=60, chunk_overlap=15)
+
+    assert len(chunks) > 1
+    for previous, current in zip(chunks, chunks[1:]):
+        assert current.startswith(previous[-15:].lstrip())
+
+
+def test_chunk_blocks_splits_oversized_block_at_separators():
+    text = "The quick brown fox. Jumps over the lazy dog. And runs away quickly"
+    assert PDFExtractor._chunk_blocks([text], chunk_size=30, chunk_overlap=5) == [
+        "The quick brown fox.",
+        "fox. Jumps over the lazy dog.",
+        "dog. And runs away quickly",
+    ]
+
+
+def test_chunk_blocks_empty_page():
+    assert PDFExtractor._chunk_blocks([], 100, 10) == []
+    assert PDFExtractor._chunk_blocks(["  ", "\n"], 100, 10) == []
+
+
+def test_iter_chunks_keeps_empty_page(pdf_path):
+    chunks = PDFExtractor().extract_chunks(pdf_path, chunk_size=200, chunk_overlap=20)
+
+    assert [c for c in chunks if c["page"] == 4] == [{"page": 4, "chunk_id": "4_1", "text": ""}]
+
+
+def test_parallel_extraction_matches_sequential(pdf_path):
+    extractor = PDFExtractor()
+
+    assert extractor.extract_pages_parallel(pdf_path, num_workers=2) == extractor.extract_pages(pdf_path)
+    assert (extractor.extract_chunks(pdf_path, 200, 20, num_workers=2)
+            == extractor.extract_chunks(pdf_path, 200, 20, num_workers=1))
+    extractor.close()
+
+
+def test_parallel_chunks_keep_a_bounded_window(pdf_path, monkeypatch):
+    submitted = []
+
+    class RecordingExecutor(ThreadPoolExecutor):
+        def submit(self, fn, *args, **kwargs):
+            submitted.append(args)
+            return super().submit(fn, *args, **kwargs)
+
+    monkeypatch.setattr(pdf_extractor, "PAGE_BATCH_SIZE", 1)
+    monkeypatch.setattr(pdf_extractor, "ProcessPoolExecutor", RecordingExecutor)
+    chunks = PDFExtractor().iter_chunks(pdf_path, 200, 20, num_workers=2)
+
+    next(chunks)
+    assert len(submitted) == pdf_extractor.BATCHES_IN_FLIGHT_PER_WORKER * 2
+    chunks.close()
+
+
+def test_open_reuses_document(pdf_path):
+    extractor = PDFExtractor()
+    doc = extractor._open(pdf_path)
+
+    assert extractor._open(pdf_path) is doc
+    assert extractor.get_page_count(pdf_path) == MIN_PAGES_FOR_PARALLEL + 5
+    assert len(extractor._documents) == 1
+    extractor.close()
+
+
+def test_open_reopens_modified_file(tmp_path):
+    path = _write_pdf(tmp_path / "doc.pdf", "first")
+    extractor = PDFExtractor()
+    first = extractor._open(path)
+
+    _write_pdf(tmp_path / "doc.pdf", "second")
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+    assert extractor._open(path) is not first
+    assert "second" in extractor.extract_pages(path)[0]["text"]
+    extractor.close()
+
+
+def test_open_evicts_and_closes_oldest(tmp_path):
+    paths = [_write_pdf(tmp_path / f"doc{i}.pdf", f"doc {i}") for i in range(MAX_CACHED_DOCUMENTS + 1)]
+    extractor = PDFExtractor()
+    docs = [extractor._open(path) for path in paths]
+
+    assert docs[0].is_closed
+    assert not any(doc.is_closed for doc in docs[1:])
+    assert len(extractor._documents) == MAX_CACHED_DOCUMENTS
+    extractor.close()
+
+
+def test_close_only_closes_own_documents(pdf_path):
+    first, second = PDFExtractor(), PDFExtractor()
+    first_doc, second_doc = first._open(pdf_path), second._open(pdf_path)
+
+    first.close()
+    assert first_doc.is_closed
+    assert not second_doc.is_closed
+    assert first.extract_pages(pdf_path) == second.extract_pages(pdf_path)
+    second.close()
@@ -0,0 +1,61 @@
+import random
+
+import pytest
+
+from src.compressors import text_compressor
+from src.compressors.text_compressor import TextCompressor
+
+
+SAMPLES = [
+    "",
+    "   ",
+    "Plain sentence, with punctuation (and brackets)?",
+    "PAGE 12\nIntroduction\n\nThe   results: 42.5% of cases; see page 3.",
+    "tabs\tand\nnewlines\r\nand  runs   of spaces",
+    "unicode — é, ü, 中文, emoji \U0001F600 and a lone surrogate \ud800",
+]
+
+
+@pytest.fixture(params=[True, False], ids=["numba", "translate"])
+def compressor(request, monkeypatch):
+    if request.param and not text_compressor.NUMBA_AVAILABLE:
+        pytest.skip("numba is not installed")
+    monkeypatch.setattr(text_compressor, "NUMBA_AVAILABLE", request.param)
+    return TextCompressor(max_chars=700)
+
+
+def _random_text(rng):
+    alphabet = "aZ9 .,;:()?-\n\t%#é€中PAGEpage 12\U0001F600"
+    return "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 80)))
+
+
+@pytest.mark.parametrize("text", SAMPLES)
+def test_compress_samples(compressor, text):
+    result = compressor.compress(text)
+
+    assert result == result.strip()
+    assert "  " not in result
+    assert "PAGE" not in result
+
+
+def test_numba_matches_translate(monkeypatch):
+    if not text_compressor.NUMBA_AVAILABLE:
+        pytest.skip("numba is not installed")
+
+    compressor = TextCompressor(max_chars=700)
+    rng = random.Random(0)
+    texts = SAMPLES + [_random_text(rng) for _ in range(2000)]
+
+    fast = [compressor.compress(text) for text in texts]
+    monkeypatch.setattr(text_compressor, "NUMBA_AVAILABLE", False)
+    assert [compressor.compress(text) for text in texts] == fast
+
+
+def test_compress_truncates(compressor):
+    compressor.max_chars = 10
+    assert compressor.compress("a" * 50) == "a" * 10
+
+
+def test_drops_case_folded_non_ascii(compressor):
+    # KELVIN SIGN and LATIN SMALL LETTER LONG S fold to ASCII letters under IGNORECASE
+    assert compressor.compress("Kſ x") == "x"